@@ -2,10 +2,19 @@
 FastAPI Fundamentals Lab - Main Application
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import (
+    get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+)
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import orjson
 
 from app.routers import books
+from app.utils import now_cached
 
 # Create FastAPI instance
 app = FastAPI(
@@ -28,6 +37,11 @@ app = FastAPI(
     4. Check library statistics at /books/stats/summary
     """,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    # Schema and docs pages are served from pre-built bytes below
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
     contact={
         "name": "FastAPI Lab Support",
         "email": "support@fastapi-lab.com"
@@ -41,32 +55,100 @@ app = FastAPI(
 # Include routers
 app.include_router(books.router, prefix="/api/v1")
 
+# Static part of the root response, serialized once without its closing brace
+_ROOT_STATIC = orjson.dumps({
+    "message": "Welcome to FastAPI Fundamentals Lab!",
+    "api_version": "1.0.0",
+    "docs": "/docs",
+    "redoc": "/redoc",
+    "features": [
+        "Book management CRUD operations",
+        "Advanced filtering and pagination", 
+        "Automatic data validation",
+        "Interactive API documentation",
+        "Library statistics"
+    ]
+})[:-1]
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Welcome to FastAPI Fundamentals Lab!",
-        "api_version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "features": [
-            "Book management CRUD operations",
-            "Advanced filtering and pagination", 
-            "Automatic data validation",
-            "Interactive API documentation",
-            "Library statistics"
-        ]
-    }
+    body = _ROOT_STATIC + b',"timestamp":' + orjson.dumps(now_cached()) + b"}"
+    return Response(content=body, media_type="application/json")
+
+# Last health response body, rebuilt only when the cached clock ticks
+_health_cache: Tuple[Optional[datetime], bytes] = (None, b"")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat()
-    }
+    global _health_cache
+    now = now_cached()
+    if _health_cache[0] is not now:
+        _health_cache = (now, orjson.dumps({"status": "healthy", "timestamp": now}))
+    return Response(content=_health_cache[1], media_type="application/json")
+
+# OpenAPI schema and docs pages are built once per ASGI root_path (which only
+# changes with deployment config) and then served as bytes, mirroring how
+# FastAPI's built-in routes prefix URLs when running behind a proxy
+def _root_path(request: Request) -> str:
+    """Get the request's root path without a trailing slash."""
+    return request.scope.get("root_path", "").rstrip("/")
+
+@lru_cache(maxsize=8)
+def _openapi_json(root_path: str) -> bytes:
+    """Serialize the OpenAPI schema, listing root_path as a server if set."""
+    schema = app.openapi()
+    servers = schema.get("servers", [])
+    if root_path and app.root_path_in_servers and root_path not in {s.get("url") for s in servers}:
+        schema = {**schema, "servers": [{"url": root_path}, *servers]}
+    return orjson.dumps(schema)
+
+@lru_cache(maxsize=8)
+def _docs_html(root_path: str) -> bytes:
+    """Build the Swagger UI page for a root path, honoring the app's Swagger UI settings."""
+    oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
+    if oauth2_redirect_url:
+        oauth2_redirect_url = root_path + oauth2_redirect_url
+    return get_swagger_ui_html(
+        openapi_url=root_path + "/openapi.json",
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=oauth2_redirect_url,
+        init_oauth=app.swagger_ui_init_oauth,
+        swagger_ui_parameters=app.swagger_ui_parameters
+    ).body
+
+@lru_cache(maxsize=8)
+def _redoc_html(root_path: str) -> bytes:
+    """Build the ReDoc page for a root path."""
+    return get_redoc_html(openapi_url=root_path + "/openapi.json", title=f"{app.title} - ReDoc").body
+
+_DOCS_OAUTH2_REDIRECT_HTML = get_swagger_ui_oauth2_redirect_html().body
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema(request: Request):
+    """Serve the pre-serialized OpenAPI schema."""
+    return Response(content=_openapi_json(_root_path(request)), media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui(request: Request):
+    """Serve the pre-built Swagger UI page."""
+    return HTMLResponse(content=_docs_html(_root_path(request)))
+
+if app.swagger_ui_oauth2_redirect_url:
+    @app.get(app.swagger_ui_oauth2_redirect_url, include_in_schema=False)
+    async def swagger_ui_oauth2_redirect():
+        """Serve the pre-built Swagger UI OAuth2 redirect page."""
+        return HTMLResponse(content=_DOCS_OAUTH2_REDIRECT_HTML)
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc(request: Request):
+    """Serve the pre-built ReDoc page."""
+    return HTMLResponse(content=_redoc_html(_root_path(request)))
 
 if __name__ == "__main__":
     import uvicorn
+    # Single process: the library lives in memory and is not shared across workers
+    # The default "auto" loop/http settings already pick uvloop and httptools
+    # when they are installed (uvicorn[standard]) and fall back elsewhere
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -4,6 +4,7 @@ Pydantic models for the book store API.
 
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
 
@@ -26,22 +27,30 @@ class BookBase(BaseModel):
     genre: BookGenre = Field(..., description="Book genre")
     publication_year: int = Field(..., ge=1000, le=2024, description="Year published")
     pages: int = Field(..., gt=0, le=10000, description="Number of pages")
-    isbn: Optional[str] = Field(None, regex=r'^\d{10}(\d{3})?$', description="ISBN-10 or ISBN-13")
+    isbn: Optional[str] = Field(None, description="ISBN-10 or ISBN-13")
     
     @validator('title', 'author')
     def validate_text_fields(cls, v):
         """Validate text fields are not just whitespace."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Field cannot be empty or only whitespace')
-        return v.strip().title()
+        return v.title()
     
     @validator('publication_year')
     def validate_publication_year(cls, v):
         """Validate publication year is not in the future."""
-        current_year = datetime.now().year
+        current_year = date.today().year
         if v > current_year:
             raise ValueError(f'Publication year cannot be greater than {current_year}')
         return v
+    
+    @validator('isbn')
+    def validate_isbn(cls, v):
+        """Validate ISBN is 10 or 13 digits."""
+        if v is not None and not (len(v) in (10, 13) and v.isdecimal()):
+            raise ValueError('ISBN must be 10 or 13 digits')
+        return v
 
 class BookCreate(BookBase):
     """Model for creating a new book."""
@@ -49,19 +58,29 @@ class BookCreate(BookBase):
 
 class BookUpdate(BaseModel):
     """Model for updating an existing book."""
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    author: Optional[str] = Field(None, min_length=1, max_length=100)
-    genre: Optional[BookGenre] = None
-    publication_year: Optional[int] = Field(None, ge=1000, le=2024)
-    pages: Optional[int] = Field(None, gt=0, le=10000)
-    isbn: Optional[str] = Field(None, regex=r'^\d{10}(\d{3})?$')
+    # Omitted fields default to None (defaults are not validated), but only
+    # isbn may be explicitly set to null
+    title: str = Field(None, min_length=1, max_length=200)
+    author: str = Field(None, min_length=1, max_length=100)
+    genre: BookGenre = None
+    publication_year: int = Field(None, ge=1000, le=2024)
+    pages: int = Field(None, gt=0, le=10000)
+    isbn: Optional[str] = None
     
     @validator('title', 'author')
     def validate_text_fields(cls, v):
         """Validate text fields are not just whitespace."""
-        if v is not None and not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Field cannot be empty or only whitespace')
-        return v.strip().title() if v else v
+        return v.title()
+    
+    @validator('isbn')
+    def validate_isbn(cls, v):
+        """Validate ISBN is 10 or 13 digits."""
+        if v is not None and not (len(v) in (10, 13) and v.isdecimal()):
+            raise ValueError('ISBN must be 10 or 13 digits')
+        return v
 
 class Book(BookBase):
     """Model for book responses."""
@@ -84,6 +103,25 @@ class Book(BookBase):
             }
         }
 
+@dataclass(slots=True)
+class StoredBook:
+    """Slotted in-memory book record; pydantic is only used at the API boundary."""
+    title: str
+    author: str
+    genre: BookGenre
+    publication_year: int
+    pages: int
+    isbn: Optional[str]
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    # Lowercased author for case-insensitive matching (internal, not part of
+    # the API payload)
+    author_lower: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.author_lower = self.author.lower()
+
 class BookListResponse(BaseModel):
     """Response model for book list with pagination."""
     books: List[Book]
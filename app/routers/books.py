@@ -2,29 +2,99 @@
 Book management endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, status, Query, Path
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Request, status, Query, Path
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from typing import AbstractSet, Dict, List, Optional, Set
+from collections import defaultdict
 from datetime import datetime
+from itertools import count, islice
 import uuid
 
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
 from app.models import (
     Book, BookCreate, BookUpdate, BookListResponse, 
-    BookGenre, ErrorResponse
+    BookGenre, ErrorResponse, StoredBook
 )
+from app.utils import now_cached
 
 # Create router
 router = APIRouter(prefix="/books", tags=["books"])
 
-# In-memory storage (for demo purposes)
-books_db: List[Book] = []
-next_id = 1
+# In-memory storage (for demo purposes), indexed by ID and ISBN
+books_by_id: Dict[int, StoredBook] = {}
+books_by_isbn: Dict[str, StoredBook] = {}
+_id_gen = count(1).__next__
+
+# Validates a whole bulk-import payload in a single pydantic-core pass
+_BulkAdapter = TypeAdapter(List[BookCreate])
+
+# Pre-serialized JSON for each stored book, rebuilt whenever the book changes
+books_json: Dict[int, bytes] = {}
+
+# Fields of a stored book that make up its API payload, in response order
+_BOOK_FIELDS = tuple(Book.model_fields)
+
+# Secondary indexes mapping filter values to book IDs (genre keyed by its
+# plain string value, which hashes in C unlike Enum.__hash__)
+idx_genre: Dict[str, Set[int]] = defaultdict(set)
+idx_year: Dict[int, Set[int]] = defaultdict(set)
+idx_author: Dict[str, Set[int]] = defaultdict(set)
+_EMPTY: AbstractSet[int] = frozenset()
+
+# Running aggregates for the statistics endpoint
+total_pages = 0
 
 def get_next_id() -> int:
     """Get next available ID."""
-    global next_id
-    current = next_id
-    next_id += 1
-    return current
+    return _id_gen()
+
+def _discard_from_index(index: Dict, key, book_id: int) -> None:
+    """Remove a book ID from an index bucket, dropping empty buckets."""
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(book_id)
+        if not ids:
+            del index[key]
+
+def _index_book(book: StoredBook) -> None:
+    """Add a book to the ISBN and secondary indexes."""
+    global total_pages
+    total_pages += book.pages
+    books_json[book.id] = orjson.dumps({name: getattr(book, name) for name in _BOOK_FIELDS})
+    if book.isbn:
+        books_by_isbn[book.isbn] = book
+    idx_genre[book.genre.value].add(book.id)
+    idx_year[book.publication_year].add(book.id)
+    idx_author[book.author_lower].add(book.id)
+
+def _unindex_book(book: StoredBook) -> None:
+    """Remove a book from the ISBN and secondary indexes."""
+    global total_pages
+    total_pages -= book.pages
+    books_json.pop(book.id, None)
+    if book.isbn:
+        books_by_isbn.pop(book.isbn, None)
+    _discard_from_index(idx_genre, book.genre.value, book.id)
+    _discard_from_index(idx_year, book.publication_year, book.id)
+    _discard_from_index(idx_author, book.author_lower, book.id)
+
+def _ensure_isbn_available(isbn: Optional[str], pending: AbstractSet[str] = _EMPTY) -> None:
+    """Reject an ISBN already used by a stored book or a pending one."""
+    if isbn and (isbn in books_by_isbn or isbn in pending):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Book with ISBN {isbn} already exists"
+        )
+
+def _store_book(book: BookCreate, created_at: datetime) -> StoredBook:
+    """Store an already validated book under a new ID and index it."""
+    new_book = StoredBook(id=get_next_id(), **book.__dict__, created_at=created_at)
+    books_by_id[new_book.id] = new_book
+    _index_book(new_book)
+    return new_book
 
 @router.post(
     "/",
@@ -38,7 +108,7 @@ def get_next_id() -> int:
         422: {"description": "Validation error"}
     }
 )
-async def create_book(book: BookCreate) -> Book:
+async def create_book(book: BookCreate) -> Response:
     """
     Create a new book in the library.
     
@@ -50,23 +120,87 @@ async def create_book(book: BookCreate) -> Book:
     - **isbn**: Optional ISBN-10 or ISBN-13
     """
     # Check for duplicate ISBN
-    if book.isbn:
-        existing_book = next((b for b in books_db if b.isbn == book.isbn), None)
-        if existing_book:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Book with ISBN {book.isbn} already exists"
-            )
+    _ensure_isbn_available(book.isbn)
+    
+    # Create new book (input is already validated, so skip re-validation)
+    new_book = _store_book(book, now_cached())
     
-    # Create new book
-    new_book = Book(
-        id=get_next_id(),
-        **book.model_dump(),
-        created_at=datetime.now()
+    # Return the JSON cached by _index_book rather than re-validating
+    # the stored book against response_model
+    return Response(
+        content=books_json[new_book.id],
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
     )
+
+@router.post(
+    "/bulk",
+    response_model=List[Book],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create books in bulk",
+    description="Add a list of books to the library in one request",
+    responses={
+        201: {"description": "Books created successfully"},
+        400: {"model": ErrorResponse, "description": "Duplicate ISBN"},
+        422: {"description": "Validation error"}
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/BookCreate"}}
+                }
+            }
+        }
+    }
+)
+async def create_books_bulk(request: Request) -> Response:
+    """
+    Create several books at once.
     
-    books_db.append(new_book)
-    return new_book
+    The body is a JSON array of books with the same fields as POST /books/.
+    Either every book is created or, on any error, none are.
+    """
+    # Report body errors in the same shape FastAPI uses for POST /books/
+    body = await request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid",
+            "loc": ("body", e.pos),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": e.msg}
+        }])
+    
+    try:
+        new_books = _BulkAdapter.validate_python(payload)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+    
+    # Check for duplicate ISBNs against the library and within the payload
+    seen_isbns: Set[str] = set()
+    for book in new_books:
+        _ensure_isbn_available(book.isbn, seen_isbns)
+        if book.isbn:
+            seen_isbns.add(book.isbn)
+    
+    created_at = now_cached()
+    fragments = [books_json[_store_book(book, created_at).id] for book in new_books]
+    
+    return Response(
+        content=b"[" + b",".join(fragments) + b"]",
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 @router.get(
     "/",
@@ -80,7 +214,7 @@ async def get_books(
     genre: Optional[BookGenre] = Query(None, description="Filter by genre"),
     author: Optional[str] = Query(None, min_length=1, description="Filter by author name"),
     year: Optional[int] = Query(None, ge=1000, le=2024, description="Filter by publication year")
-) -> BookListResponse:
+) -> Response:
     """
     Get a list of books with optional filtering.
     
@@ -89,31 +223,47 @@ async def get_books(
     - **author**: Author name (partial match)
     - **year**: Publication year
     """
-    # Apply filters
-    filtered_books = books_db.copy()
+    # Apply filters by intersecting index buckets
+    # Buckets are read in place: nothing below mutates candidate_ids, since
+    # & and the author union always build new sets
+    candidate_ids: Optional[AbstractSet[int]] = None
     
     if genre:
-        filtered_books = [b for b in filtered_books if b.genre == genre]
+        candidate_ids = idx_genre.get(genre.value, _EMPTY)
+    
+    if year:
+        year_ids = idx_year.get(year, _EMPTY)
+        candidate_ids = year_ids if candidate_ids is None else candidate_ids & year_ids
     
     if author:
+        # Partial match only needs to scan distinct author names
         author_lower = author.lower()
-        filtered_books = [b for b in filtered_books if author_lower in b.author.lower()]
+        author_ids = set()
+        for name, ids in idx_author.items():
+            if author_lower in name:
+                author_ids |= ids
+        candidate_ids = author_ids if candidate_ids is None else candidate_ids & author_ids
     
-    if year:
-        filtered_books = [b for b in filtered_books if b.publication_year == year]
-    
-    # Pagination
-    total = len(filtered_books)
-    paginated_books = filtered_books[skip:skip + limit]
+    # Pagination (IDs are assigned in insertion order)
+    if candidate_ids is None:
+        total = len(books_by_id)
+        paginated_books = list(islice(books_by_id.values(), skip, skip + limit))
+    else:
+        total = len(candidate_ids)
+        paginated_books = [books_by_id[i] for i in sorted(candidate_ids)[skip:skip + limit]]
     has_next = skip + limit < total
     
-    return BookListResponse(
-        books=paginated_books,
-        total=total,
-        page=(skip // limit) + 1,
-        limit=limit,
-        has_next=has_next
-    )
+    # Join the cached book JSON into a single body instead of re-serializing
+    # models; the fragments are already in memory, so streaming them would
+    # only add per-chunk sends and drop Content-Length
+    meta = orjson.dumps({
+        "total": total,
+        "page": (skip // limit) + 1,
+        "limit": limit,
+        "has_next": has_next
+    })
+    body = b'{"books":[' + b",".join(books_json[b.id] for b in paginated_books) + b"]," + meta[1:]
+    return Response(content=body, media_type="application/json")
 
 @router.get(
     "/{book_id}",
@@ -127,15 +277,15 @@ async def get_books(
 )
 async def get_book(
     book_id: int = Path(..., gt=0, description="Book ID")
-) -> Book:
+) -> Response:
     """Get a specific book by ID."""
-    book = next((b for b in books_db if b.id == book_id), None)
+    book = books_by_id.get(book_id)
     if not book:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Book with ID {book_id} not found"
         )
-    return book
+    return Response(content=books_json[book_id], media_type="application/json")
 
 @router.put(
     "/{book_id}",
@@ -151,10 +301,10 @@ async def get_book(
 async def update_book(
     book_id: int = Path(..., gt=0, description="Book ID"),
     book_update: BookUpdate = ...
-) -> Book:
+) -> Response:
     """Update an existing book."""
-    book_index = next((i for i, b in enumerate(books_db) if b.id == book_id), None)
-    if book_index is None:
+    existing_book = books_by_id.get(book_id)
+    if existing_book is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Book with ID {book_id} not found"
@@ -162,23 +312,29 @@ async def update_book(
     
     # Check ISBN uniqueness if updating
     if book_update.isbn:
-        existing_book = next((b for b in books_db if b.isbn == book_update.isbn and b.id != book_id), None)
-        if existing_book:
+        isbn_owner = books_by_isbn.get(book_update.isbn)
+        if isbn_owner is not None and isbn_owner.id != book_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Book with ISBN {book_update.isbn} already exists"
             )
     
-    # Update book
-    existing_book = books_db[book_index]
-    update_data = book_update.model_dump(exclude_unset=True)
+    # Collect the new values before touching the indexes, so nothing can
+    # fail while the book is unindexed
+    changes = {field: getattr(book_update, field) for field in book_update.model_fields_set}
+    
+    # Update book, re-indexing around the change
+    _unindex_book(existing_book)
     
-    for field, value in update_data.items():
+    for field, value in changes.items():
         setattr(existing_book, field, value)
+    if "author" in changes:
+        existing_book.author_lower = existing_book.author.lower()
     
-    existing_book.updated_at = datetime.now()
+    existing_book.updated_at = now_cached()
+    _index_book(existing_book)
     
-    return existing_book
+    return Response(content=books_json[book_id], media_type="application/json")
 
 @router.delete(
     "/{book_id}",
@@ -194,14 +350,14 @@ async def delete_book(
     book_id: int = Path(..., gt=0, description="Book ID")
 ):
     """Delete a book from the library."""
-    book_index = next((i for i, b in enumerate(books_db) if b.id == book_id), None)
-    if book_index is None:
+    book = books_by_id.pop(book_id, None)
+    if book is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Book with ID {book_id} not found"
         )
     
-    books_db.pop(book_index)
+    _unindex_book(book)
     return None
 
 # Statistics endpoints
@@ -212,36 +368,33 @@ async def delete_book(
 )
 async def get_library_stats():
     """Get library statistics."""
-    if not books_db:
-        return {
+    if not books_by_id:
+        return ORJSONResponse(content={
             "total_books": 0,
             "genres": {},
             "average_pages": 0,
             "publication_year_range": None
-        }
+        })
     
-    # Calculate statistics
-    total_books = len(books_db)
+    # Calculate statistics from the maintained aggregates
+    total_books = len(books_by_id)
     
-    # Genre distribution
-    genre_counts = {}
-    for book in books_db:
-        genre_counts[book.genre] = genre_counts.get(book.genre, 0) + 1
+    # Genre distribution, read straight off the genre index
+    genre_counts = {g: len(ids) for g, ids in idx_genre.items()}
     
     # Average pages
-    total_pages = sum(book.pages for book in books_db)
     average_pages = round(total_pages / total_books) if total_books > 0 else 0
     
-    # Publication year range
-    years = [book.publication_year for book in books_db]
+    # Publication year range (only distinct years are scanned)
     year_range = {
-        "earliest": min(years),
-        "latest": max(years)
+        "earliest": min(idx_year),
+        "latest": max(idx_year)
     }
     
-    return {
+    # Plain data only, so hand it straight to orjson without jsonable_encoder
+    return ORJSONResponse(content={
         "total_books": total_books,
         "genres": genre_counts,
         "average_pages": average_pages,
         "publication_year_range": year_range
-    }
+    })
@@ -0,0 +1,18 @@
+"""
+Shared helpers for the book store API.
+"""
+
+from datetime import datetime
+from typing import Tuple
+import time
+
+# (monotonic tick, datetime) of the last clock refresh
+_now_cache: Tuple[float, datetime] = (float("-inf"), datetime.now())
+
+def now_cached() -> datetime:
+    """Get the current time, refreshed at most once per second."""
+    global _now_cache
+    tick = time.monotonic()
+    if tick - _now_cache[0] >= 1.0:
+        _now_cache = (tick, datetime.now())
+    return _now_cache[1]
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the API tests.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import books
+
+@pytest.fixture(autouse=True)
+def reset_library():
+    """Start every test with an empty in-memory library."""
+    for store in (
+        books.books_by_id, books.books_by_isbn, books.books_json,
+        books.idx_genre, books.idx_year, books.idx_author
+    ):
+        store.clear()
+    books.total_pages = 0
+    yield
+
+@pytest.fixture
+def client():
+    """Test client for the application."""
+    return TestClient(app)
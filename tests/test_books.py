@@ -0,0 +1,288 @@
+"""
+Tests for the book management endpoints.
+"""
+
+import pytest
+
+BOOKS_URL = "/api/v1/books/"
+STATS_URL = "/api/v1/books/stats/summary"
+BULK_URL = "/api/v1/books/bulk"
+
+def book_payload(**overrides):
+    """Build a valid book creation payload."""
+    payload = {
+        "title": "Dune",
+        "author": "Frank Herbert",
+        "genre": "science-fiction",
+        "publication_year": 1965,
+        "pages": 412,
+    }
+    payload.update(overrides)
+    return payload
+
+def assert_stats_consistent(client):
+    """Check /stats/summary against the books actually returned by the API."""
+    listing = client.get(BOOKS_URL, params={"limit": 100}).json()
+    stored = listing["books"]
+    stats = client.get(STATS_URL).json()
+    
+    assert listing["total"] == len(stored)
+    assert stats["total_books"] == len(stored)
+    if not stored:
+        assert stats["genres"] == {}
+        assert stats["average_pages"] == 0
+        assert stats["publication_year_range"] is None
+        return
+    
+    genres = {}
+    for book in stored:
+        genres[book["genre"]] = genres.get(book["genre"], 0) + 1
+    years = [book["publication_year"] for book in stored]
+    
+    assert stats["genres"] == genres
+    assert stats["average_pages"] == round(sum(b["pages"] for b in stored) / len(stored))
+    assert stats["publication_year_range"] == {"earliest": min(years), "latest": max(years)}
+
+@pytest.fixture
+def make_book(client):
+    """Create a book through the API from book_payload(**overrides)."""
+    def _make_book(**overrides):
+        response = client.post(BOOKS_URL, json=book_payload(**overrides))
+        assert response.status_code == 201, response.text
+        return response.json()
+    return _make_book
+
+def test_create_and_get_book(client, make_book):
+    book = make_book(title="  dune  ", isbn="9780441013593")
+    
+    assert book["title"] == "Dune"
+    assert book["updated_at"] is None
+    assert client.get(f"{BOOKS_URL}{book['id']}").json() == book
+    assert client.get(f"{BOOKS_URL}{book['id'] + 1}").status_code == 404
+
+def test_create_rejects_duplicate_isbn(client, make_book):
+    make_book(isbn="9780441013593")
+    
+    response = client.post(BOOKS_URL, json=book_payload(title="Dune Messiah", isbn="9780441013593"))
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Book with ISBN 9780441013593 already exists"
+
+def test_update_moves_isbn_index(client, make_book):
+    dune = make_book(isbn="9780441013593")
+    other = make_book(title="Dune Messiah", isbn="9780441172696")
+    
+    # Taking another book's ISBN is rejected, keeping your own is fine
+    assert client.put(f"{BOOKS_URL}{dune['id']}", json={"isbn": "9780441172696"}).status_code == 400
+    assert client.put(f"{BOOKS_URL}{other['id']}", json={"isbn": "9780441172696"}).status_code == 200
+    
+    response = client.put(f"{BOOKS_URL}{dune['id']}", json={"isbn": "9780441013600"})
+    assert response.status_code == 200, response.text
+    assert response.json()["updated_at"] is not None
+    
+    # The old ISBN is free again, the new one is taken
+    assert client.post(BOOKS_URL, json=book_payload(isbn="9780441013600")).status_code == 400
+    make_book(isbn="9780441013593")
+
+def test_update_allows_clearing_isbn(client, make_book):
+    book = make_book(isbn="1234567890")
+    
+    response = client.put(f"{BOOKS_URL}{book['id']}", json={"isbn": None})
+    
+    assert response.status_code == 200
+    assert response.json()["isbn"] is None
+    make_book(isbn="1234567890")
+
+def test_delete_book_frees_id_and_isbn(client, make_book):
+    book = make_book(isbn="1234567890")
+    
+    assert client.delete(f"{BOOKS_URL}{book['id']}").status_code == 204
+    assert client.delete(f"{BOOKS_URL}{book['id']}").status_code == 404
+    assert client.get(f"{BOOKS_URL}{book['id']}").status_code == 404
+    make_book(isbn="1234567890")
+
+def test_get_books_filters_and_paginates(client, make_book):
+    ids = [
+        make_book(author="Rowan Atkinson", genre="fiction", publication_year=2001)["id"],
+        make_book(author="Row Ling", genre="fantasy", publication_year=1997)["id"],
+        make_book(author="Jane Doe", genre="fantasy", publication_year=2001)["id"],
+    ]
+    
+    assert client.get(BOOKS_URL, params={"author": "ROW"}).json()["total"] == 2
+    result = client.get(BOOKS_URL, params={"author": "row", "genre": "fantasy"}).json()
+    assert [b["id"] for b in result["books"]] == [ids[1]]
+    result = client.get(BOOKS_URL, params={"genre": "fantasy", "year": 2001}).json()
+    assert [b["id"] for b in result["books"]] == [ids[2]]
+    assert client.get(BOOKS_URL, params={"genre": "history"}).json()["total"] == 0
+    
+    first = client.get(BOOKS_URL, params={"limit": 2}).json()
+    assert [b["id"] for b in first["books"]] == ids[:2]
+    assert first["has_next"] is True
+    second = client.get(BOOKS_URL, params={"limit": 2, "skip": 2}).json()
+    assert [b["id"] for b in second["books"]] == ids[2:]
+    assert second == {"books": second["books"], "total": 3, "page": 2, "limit": 2, "has_next": False}
+
+def test_filters_follow_updates_and_deletes(client, make_book):
+    dune = make_book()
+    hobbit = make_book(title="The Hobbit", author="J.R.R. Tolkien", genre="fantasy", publication_year=1937)
+    
+    response = client.put(
+        f"{BOOKS_URL}{dune['id']}",
+        json={"author": "Brian Herbert", "genre": "fantasy", "publication_year": 1999}
+    )
+    assert response.status_code == 200, response.text
+    
+    # Filters see the updated values, not the old ones
+    assert client.get(BOOKS_URL, params={"author": "frank"}).json()["total"] == 0
+    assert client.get(BOOKS_URL, params={"genre": "science-fiction"}).json()["total"] == 0
+    fantasy_1999 = client.get(BOOKS_URL, params={"genre": "fantasy", "year": 1999}).json()
+    assert [b["id"] for b in fantasy_1999["books"]] == [dune["id"]]
+    
+    assert client.delete(f"{BOOKS_URL}{hobbit['id']}").status_code == 204
+    assert client.get(BOOKS_URL, params={"author": "tolkien"}).json()["total"] == 0
+    assert client.get(BOOKS_URL, params={"year": 1937}).json()["total"] == 0
+
+@pytest.mark.parametrize("field", ["title", "author", "genre", "publication_year", "pages"])
+def test_update_rejects_null_for_required_fields(client, make_book, field):
+    book = make_book()
+    
+    response = client.put(f"{BOOKS_URL}{book['id']}", json={field: None})
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", field]
+    # The failed update must leave the book readable and fully indexed
+    assert client.get(f"{BOOKS_URL}{book['id']}").json() == book
+    assert client.get(BOOKS_URL, params={"author": "herbert"}).json()["total"] == 1
+
+def test_update_schema_only_allows_null_isbn(client):
+    properties = client.get("/openapi.json").json()["components"]["schemas"]["BookUpdate"]["properties"]
+    
+    assert {"type": "null"} in properties["isbn"]["anyOf"]
+    for field in ("title", "author", "genre", "publication_year", "pages"):
+        assert "anyOf" not in properties[field]
+
+def test_stats_follow_create_update_delete(client, make_book):
+    assert_stats_consistent(client)
+    
+    dune = make_book()
+    hobbit = make_book(title="The Hobbit", author="J.R.R. Tolkien", genre="fantasy",
+                       publication_year=1937, pages=310)
+    make_book(title="Sapiens", author="Yuval Noah Harari", genre="history",
+              publication_year=2011, pages=443)
+    assert_stats_consistent(client)
+    
+    response = client.put(
+        f"{BOOKS_URL}{dune['id']}",
+        json={"genre": "fantasy", "publication_year": 2015, "pages": 500}
+    )
+    assert response.status_code == 200, response.text
+    assert_stats_consistent(client)
+    assert client.get(STATS_URL).json()["publication_year_range"]["latest"] == 2015
+    
+    assert client.delete(f"{BOOKS_URL}{hobbit['id']}").status_code == 204
+    assert_stats_consistent(client)
+    assert client.get(STATS_URL).json()["publication_year_range"]["earliest"] == 2011
+    
+    for book in client.get(BOOKS_URL).json()["books"]:
+        client.delete(f"{BOOKS_URL}{book['id']}")
+    assert_stats_consistent(client)
+
+def test_stats_unchanged_by_rejected_update(client, make_book):
+    book = make_book()
+    before = client.get(STATS_URL).json()
+    
+    assert client.put(f"{BOOKS_URL}{book['id']}", json={"pages": None}).status_code == 422
+    
+    assert client.get(STATS_URL).json() == before
+
+@pytest.mark.parametrize("isbn", ["123456789", "123456789X", "12345678901", "978-0441013593"])
+def test_invalid_isbn_rejected(client, make_book, isbn):
+    response = client.post(BOOKS_URL, json=book_payload(isbn=isbn))
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "isbn"]
+    
+    book = make_book()
+    response = client.put(f"{BOOKS_URL}{book['id']}", json={"isbn": isbn})
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "isbn"]
+
+@pytest.mark.parametrize("isbn", ["1234567890", "9780441013593"])
+def test_valid_isbn_accepted(make_book, isbn):
+    assert make_book(isbn=isbn)["isbn"] == isbn
+
+def test_bulk_create(client, make_book):
+    make_book()
+    
+    response = client.post(BULK_URL, json=[
+        book_payload(isbn="1234567890"),
+        book_payload(title="  children of dune  ", isbn=None),
+    ])
+    
+    assert response.status_code == 201, response.text
+    created = response.json()
+    assert [b["title"] for b in created] == ["Dune", "Children Of Dune"]
+    assert client.get(f"{BOOKS_URL}{created[0]['id']}").json() == created[0]
+    assert client.post(BOOKS_URL, json=book_payload(isbn="1234567890")).status_code == 400
+    assert_stats_consistent(client)
+
+def test_bulk_rejects_duplicate_isbn_within_payload(client):
+    response = client.post(BULK_URL, json=[
+        book_payload(isbn="1234567890"),
+        book_payload(title="Dune Messiah", isbn="1234567890"),
+    ])
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Book with ISBN 1234567890 already exists"
+    # All-or-nothing: the first book was not inserted either
+    assert client.get(BOOKS_URL).json()["total"] == 0
+    assert_stats_consistent(client)
+
+def test_bulk_rejects_isbn_already_in_library(client, make_book):
+    make_book(isbn="1234567890")
+    
+    response = client.post(BULK_URL, json=[
+        book_payload(isbn="9999999999"),
+        book_payload(isbn="1234567890"),
+    ])
+    
+    assert response.status_code == 400
+    assert client.get(BOOKS_URL).json()["total"] == 1
+
+def test_bulk_validation_error_locations(client):
+    response = client.post(BULK_URL, json=[
+        book_payload(),
+        book_payload(isbn="12345"),
+        book_payload(pages=0),
+    ])
+    
+    assert response.status_code == 422
+    locations = [error["loc"] for error in response.json()["detail"]]
+    assert locations == [["body", 1, "isbn"], ["body", 2, "pages"]]
+    assert client.get(BOOKS_URL).json()["total"] == 0
+
+def test_bulk_requires_a_list(client):
+    response = client.post(BULK_URL, json=book_payload())
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body"]
+
+@pytest.mark.parametrize("url", [BOOKS_URL, BULK_URL])
+def test_create_endpoints_share_invalid_json_error(client, url):
+    response = client.post(url, content=b"[{", headers={"Content-Type": "application/json"})
+    
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 2]
+    assert error["msg"] == "JSON decode error"
+
+@pytest.mark.parametrize("url", [BOOKS_URL, BULK_URL])
+def test_create_endpoints_share_missing_body_error(client, url):
+    response = client.post(url, content=b"", headers={"Content-Type": "application/json"})
+    
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}
+    ]
@@ -0,0 +1,70 @@
+"""
+Tests for the cached OpenAPI schema and documentation pages.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.main import app
+
+@pytest.fixture(autouse=True)
+def clear_docs_cache():
+    """Rebuild the cached schema and pages for every test."""
+    for cached in (main._openapi_json, main._docs_html, main._redoc_html):
+        cached.cache_clear()
+    yield
+    for cached in (main._openapi_json, main._docs_html, main._redoc_html):
+        cached.cache_clear()
+
+def test_openapi_schema(client):
+    response = client.get("/openapi.json")
+    
+    assert response.status_code == 200
+    schema = json.loads(response.content)
+    assert schema["info"]["title"] == "FastAPI Fundamentals Lab"
+    assert "/api/v1/books/" in schema["paths"]
+    assert "/openapi.json" not in schema["paths"]
+    assert "servers" not in schema
+
+def test_docs_pages(client):
+    docs = client.get("/docs")
+    assert docs.status_code == 200
+    assert docs.headers["content-type"].startswith("text/html")
+    assert "url: '/openapi.json'" in docs.text
+    assert "window.location.origin + '/docs/oauth2-redirect'" in docs.text
+    
+    redoc = client.get("/redoc")
+    assert redoc.status_code == 200
+    assert 'spec-url="/openapi.json"' in redoc.text
+    
+    redirect = client.get("/docs/oauth2-redirect")
+    assert redirect.status_code == 200
+    assert "oauth2" in redirect.text
+
+def test_docs_behind_root_path():
+    client = TestClient(app, root_path="/proxy")
+    
+    schema = json.loads(client.get("/openapi.json").content)
+    assert schema["servers"] == [{"url": "/proxy"}]
+    
+    docs = client.get("/docs").text
+    assert "url: '/proxy/openapi.json'" in docs
+    assert "window.location.origin + '/proxy/docs/oauth2-redirect'" in docs
+    assert 'spec-url="/proxy/openapi.json"' in client.get("/redoc").text
+    
+    # The root path is part of the cache key, so plain requests are unaffected
+    plain = TestClient(app)
+    assert "servers" not in json.loads(plain.get("/openapi.json").content)
+    assert "url: '/openapi.json'" in plain.get("/docs").text
+
+def test_docs_forward_swagger_ui_settings(client, monkeypatch):
+    monkeypatch.setattr(app, "swagger_ui_parameters", {"deepLinking": False})
+    monkeypatch.setattr(app, "swagger_ui_init_oauth", {"clientId": "lab-client"})
+    
+    docs = client.get("/docs").text
+    
+    assert '"deepLinking": false' in docs
+    assert "ui.initOAuth" in docs and '"clientId": "lab-client"' in docs
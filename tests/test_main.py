@@ -0,0 +1,56 @@
+"""
+Tests for the application-level endpoints.
+"""
+
+import json
+from datetime import datetime
+
+from app import main, utils
+
+def test_root_returns_api_information(client):
+    response = client.get("/")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = json.loads(response.content)
+    assert list(body) == ["message", "api_version", "docs", "redoc", "features", "timestamp"]
+    assert body["api_version"] == "1.0.0"
+    assert body["docs"] == "/docs"
+    assert len(body["features"]) == 5
+    datetime.fromisoformat(body["timestamp"])
+
+def test_health_returns_status_and_timestamp(client):
+    response = client.get("/health")
+    
+    assert response.status_code == 200
+    body = json.loads(response.content)
+    assert list(body) == ["status", "timestamp"]
+    assert body["status"] == "healthy"
+    datetime.fromisoformat(body["timestamp"])
+
+def test_health_body_reused_within_clock_tick(client, monkeypatch):
+    tick = datetime(2024, 1, 15, 10, 30)
+    monkeypatch.setattr(main, "now_cached", lambda: tick)
+    monkeypatch.setattr(main, "_health_cache", (None, b""))
+    
+    first = client.get("/health").content
+    cached = main._health_cache[1]
+    assert client.get("/health").content == first
+    assert main._health_cache[1] is cached
+    assert json.loads(first)["timestamp"] == "2024-01-15T10:30:00"
+    
+    next_tick = datetime(2024, 1, 15, 10, 30, 1)
+    monkeypatch.setattr(main, "now_cached", lambda: next_tick)
+    assert json.loads(client.get("/health").content)["timestamp"] == "2024-01-15T10:30:01"
+    assert main._health_cache[1] is not cached
+
+def test_now_cached_refreshes_once_per_second(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(utils, "_now_cache", (float("-inf"), datetime.now()))
+    
+    first = utils.now_cached()
+    clock[0] = 1000.9
+    assert utils.now_cached() is first
+    clock[0] = 1001.0
+    assert utils.now_cached() is not first